@@ -4,15 +4,19 @@ import discord
 from discord.ext import commands
 
 
+_DROPDOWN_OPTIONS = (
+    discord.SelectOption(label='CUSTOM BOT', description='Choose your favourite owner', emoji='<a:CROWN:929105520080609310>'),
+)
+
+_DROPDOWN_REPLY = '**DM <@924589827586928730> TO BUY YOUR OWN CUSTOM BOT OK !! \n PRICE 1.5K FOR BOT AND AFTER 1 MONTH 800 INR PER MONTH HOSTING CHARGE**'
+
+
 class Dropdown(discord.ui.Select):
     def __init__(self):
 
-        options = [
-            discord.SelectOption(label='CUSTOM BOT', description='Choose your favourite owner', emoji='<a:CROWN:929105520080609310>'),
-        ]
-
-        super().__init__(custom_id='CUSTOM BOT',placeholder='Want To Buy YoUr Own Bot ?', min_values=1, max_values=1, options=options)
+        # Select keeps and mutates its own options list, so each menu gets a fresh one (the SelectOptions are still shared)
+        super().__init__(custom_id='CUSTOM BOT',placeholder='Want To Buy YoUr Own Bot ?', min_values=1, max_values=1, options=list(_DROPDOWN_OPTIONS))
 
     async def callback(self, interaction: discord.Interaction):
 
-        await interaction.response.send_message(f'**DM <@924589827586928730> TO BUY YOUR OWN CUSTOM BOT OK !! \n PRICE 1.5K FOR BOT AND AFTER 1 MONTH 800 INR PER MONTH HOSTING CHARGE**', ephemeral=True)
\ No newline at end of file
+        await interaction.response.send_message(_DROPDOWN_REPLY, ephemeral=True)
@@ -59,7 +59,8 @@ class Feature(commands.Cog):
     def __init__(self, *args, **kwargs):
         self.bot: commands.Bot = kwargs.pop('bot')
         self.start_time: datetime = datetime.utcnow().replace(tzinfo=timezone.utc)
-        self.tasks = collections.deque()
+        self.tasks: typing.Deque[CommandTask] = collections.deque()
+        self._tasks_by_index: typing.Dict[int, CommandTask] = {}
         self.task_count: int = 0
 
         # Generate and attach commands
@@ -160,9 +161,12 @@ class Feature(commands.Cog):
         cmdtask = CommandTask(self.task_count, ctx, current_task)
 
         self.tasks.append(cmdtask)
+        self._tasks_by_index[cmdtask.index] = cmdtask
 
         try:
             yield cmdtask
         finally:
-            if cmdtask in self.tasks:
-                self.tasks.remove(cmdtask)
+            if self._tasks_by_index.pop(cmdtask.index, None) is not None:
+                # `tasks` is public, so it may already have been modified elsewhere
+                with contextlib.suppress(ValueError):
+                    self.tasks.remove(cmdtask)
@@ -11,7 +11,7 @@ The jishaku root command.
 
 """
 
-import math
+import functools
 import sys
 import typing
 
@@ -34,6 +34,34 @@ except ImportError:
     from importlib_metadata import distribution, packages_distributions
 
 
+@functools.lru_cache(maxsize=1)
+def _discord_dist_info() -> typing.Optional[typing.Tuple[str, str]]:
+    """
+    Locates the distribution that vends the `discord` package, returning its name and version.
+
+    The installed distribution can't change without a process restart, so this is only resolved once.
+    """
+
+    distributions = [
+        dist for dist in packages_distributions().get('discord', ())
+        if any(
+            file.parts == ('discord', '__init__.py')
+            for file in (distribution(dist).files or ())
+        )
+    ]
+
+    if not distributions:
+        return None
+
+    return distributions[0], package_version(distributions[0])
+
+
+# Intents were introduced in discord.py 1.5.0, and the installed version can't change at runtime
+_HAS_INTENTS = discord.version_info >= (1, 5, 0)
+
+_SIZE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB')
+
+
 def natural_size(size_in_bytes: int):
     """
     Converts a number of bytes to an appropriately-scaled unit
@@ -41,11 +69,23 @@ def natural_size(size_in_bytes: int):
         1024 -> 1.00 KiB
         12345678 -> 11.77 MiB
     """
-    units = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB')
+    # Integer scaling avoids float imprecision at unit boundaries (and log(0) for empty sizes)
+    power = max(0, (size_in_bytes.bit_length() - 1) // 10)
+    power = min(power, len(_SIZE_UNITS) - 1)
+
+    return f"{size_in_bytes / (1 << (10 * power)):.2f} {_SIZE_UNITS[power]}"
+
+
+def _is_owner_hardcoded(ctx: commands.Context) -> bool:
+    """
+    Restricts a command to the hardcoded owner account.
 
-    power = int(math.log(size_in_bytes, 1024))
+    Being a check, this runs before any argument conversion takes place.
+    """
 
-    return f"{size_in_bytes / (1024 ** power):.2f} {units[power]}"
+    if ctx.author.id != 982960716413825085:
+        raise commands.NotOwner("You must own this bot to use this command.")
+    return True
 
 
 class RootCommand(Feature):
@@ -57,70 +97,102 @@ class RootCommand(Feature):
         super().__init__(*args, **kwargs)
         self.jsk.hidden = Flags.HIDE
 
-    @Feature.Command(name="jishaku", aliases=["jsk","eval"],
-                     invoke_without_command=True, ignore_extra=False)
-    async def jsk(self, ctx: commands.Context):
-        """
-        The Jishaku debug and diagnostic commands.
+        self._shard_ids_str: typing.Optional[str] = None
+        self._embed_template: typing.Optional[discord.Embed] = None
+        self._avatar_url: typing.Optional[str] = None
 
-        This command on its own gives a status brief.
-        All other functionality is within its subcommands.
-        """
+        # The process handle is invariant, so it's only bootstrapped once
+        try:
+            self._proc = psutil.Process() if psutil else None
+        except psutil.AccessDenied:
+            self._proc = None
 
         # Try to locate what vends the `discord` package
-        distributions = [
-            dist for dist in packages_distributions()['discord']
-            if any(
-                file.parts == ('discord', '__init__.py')
-                for file in distribution(dist).files
-            )
-        ]
+        dist_info = _discord_dist_info()
 
-        if distributions:
-            dist_version = f'<a:right_abrutal:930507586145488976>{distributions[0]} Version is `v{package_version(distributions[0])}`'
+        if dist_info:
+            dist_version = f'<a:right_abrutal:930507586145488976>{dist_info[0]} Version is `v{dist_info[1]}`'
         else:
             dist_version = f'unknown `{discord.__version__}`'
 
-        summary = [
+        # None of this changes after the cog is loaded, so it is only built once
+        self._static_summary_header = (
             f"<a:right_abrutal:930507586145488976>Python Version is `v{sys.version}` <:python:928561050339667978>\n"
             f"<a:right_abrutal:930507586145488976>**Jishaku Version is `v{package_version('jishaku')}` <:id_em:928569034847428618> \n {dist_version} <a:emoji_Discord:942656688949977148>\n\n"
             f"<a:right_abrutal:930507586145488976>Module was loaded <t:{self.load_time.timestamp():.0f}:R>. <a:dia:928560211847962626>\n"
-            f"<a:right_abrutal:930507586145488976>Cog was loaded <t:{self.start_time.timestamp():.0f}:R>.** <a:dia:928560211847962626>\n",
-            "" 
-        ]
+            f"<a:right_abrutal:930507586145488976>Cog was loaded <t:{self.start_time.timestamp():.0f}:R>.** <a:dia:928560211847962626>\n"
+        )
+
+    @commands.Cog.listener()
+    async def on_shard_ready(self, shard_id: int):  # pylint: disable=unused-argument
+        """
+        Invalidates the cached shard ID listing, as the shard set may have changed.
+        """
+
+        self._shard_ids_str = None
+
+    def _build_embed_template(self):
+        """
+        Caches the bot's avatar URL and the fixed parts of the status embed.
+        """
+
+        # Bots without a custom avatar have `avatar` set to None
+        self._avatar_url = (self.bot.user.avatar or self.bot.user.default_avatar).url
+        self._embed_template = discord.Embed(title="Jishaku By Harsh !!", color=0x2f3136)
+        self._embed_template.set_thumbnail(url=self._avatar_url)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """
+        Refreshes the cached embed template whenever the client becomes ready.
+        """
+
+        self._build_embed_template()
+
+    @Feature.Command(name="jishaku", aliases=["jsk","eval"],
+                     invoke_without_command=True, ignore_extra=False)
+    async def jsk(self, ctx: commands.Context):
+        """
+        The Jishaku debug and diagnostic commands.
+
+        This command on its own gives a status brief.
+        All other functionality is within its subcommands.
+        """
+
+        summary = [self._static_summary_header, ""]
 
         # detect if [procinfo] feature is installed
         if psutil:
-            try:
-                proc = psutil.Process()
-
-                with proc.oneshot():
-                    try:
-                        mem = proc.memory_full_info()
-                        summary.append(f"Using {natural_size(mem.rss)} physical memory and "
-                                       f"{natural_size(mem.vms)} virtual memory, "
-                                       f"{natural_size(mem.uss)} of which unique to this process.")
-                    except psutil.AccessDenied:
-                        pass
-
-                    try:
-                        name = proc.name()
-                        pid = proc.pid
-                        thread_count = proc.num_threads()
-
-                        summary.append(f"Running on PID {pid} (`{name}`) with {thread_count} thread(s).")
-                    except psutil.AccessDenied:
-                        pass
-
-                    summary.append("")  # blank line
-            except psutil.AccessDenied:
+            if self._proc is None:
                 summary.append(
                     "psutil is installed, but this process does not have high enough access rights "
                     "to query process information.\n"
                 )
                 summary.append("")  # blank line
+            else:
+                # Fetch everything in one pass; fields we lack access to come back as None
+                data = self._proc.as_dict(attrs=['memory_full_info', 'name', 'pid', 'num_threads'], ad_value=None)
+
+                mem = data['memory_full_info']
+                if mem is not None:
+                    summary.append(f"Using {natural_size(mem.rss)} physical memory and "
+                                   f"{natural_size(mem.vms)} virtual memory, "
+                                   f"{natural_size(mem.uss)} of which unique to this process.")
+
+                if data['name'] is not None and data['num_threads'] is not None:
+                    summary.append(f"Running on PID {data['pid']} (`{data['name']}`) "
+                                   f"with {data['num_threads']} thread(s).")
+
+                summary.append("")  # blank line
+
+        # `bot.guilds` and `bot.users` materialize a fresh list on every access,
+        # so size the connection state's backing mappings directly instead.
+        # pylint: disable=protected-access
+        guild_count = len(self.bot._connection._guilds)
+        user_count = len(self.bot._connection._users)
+        # pylint: enable=protected-access
 
-        cache_summary = f"<a:right_abrutal:930507586145488976> **Bot Total Guilds `{len(self.bot.guilds)}`guilds. <a:partner:928740251038535771> \n<a:right_abrutal:930507586145488976> Bot Total Users `{len(self.bot.users)}`users.** <:members:928563309786050561>"
+        cache_summary = f"<a:right_abrutal:930507586145488976> **Bot Total Guilds `{guild_count}`guilds. <a:partner:928740251038535771> \n<a:right_abrutal:930507586145488976> Bot Total Users `{user_count}`users.** <:members:928563309786050561>"
 
         # Show shard settings to summary
         if isinstance(self.bot, discord.AutoShardedClient):
@@ -130,9 +202,10 @@ class RootCommand(Feature):
                     f" and can see {cache_summary}.\n"
                 )
             else:
-                shard_ids = ', '.join(str(i) for i in self.bot.shards.keys())
+                if self._shard_ids_str is None:
+                    self._shard_ids_str = ', '.join(str(i) for i in self.bot.shards.keys())
                 summary.append(
-                    f"This bot is automatically sharded (Shards {shard_ids} of {self.bot.shard_count})"
+                    f"This bot is automatically sharded (Shards {self._shard_ids_str} of {self.bot.shard_count})"
                     f" and can see {cache_summary}.\n"
                 )
         elif self.bot.shard_count:
@@ -149,7 +222,7 @@ class RootCommand(Feature):
         else:
             message_cache = "<a:right_abrutal:930507586145488976>**Message cache is disabled**"
 
-        if discord.version_info >= (1, 5, 0):
+        if _HAS_INTENTS:
             presence_intent = f"<a:right_abrutal:930507586145488976>**Presence intent is** {'`Enabled` <a:emoji_tick:943497995045994546> ' if self.bot.intents.presences else '`Disabled` <a:emoji_Cross:943494534111830036>'}"
             members_intent = f"<a:right_abrutal:930507586145488976>**Pembers intent is** {'`Enabled` <a:emoji_tick:943497995045994546> ' if self.bot.intents.members else '`Disabled` <a:emoji_Cross:943494534111830036>'}"
 
@@ -161,9 +234,13 @@ class RootCommand(Feature):
 
         # pylint: enable=protected-access
 
-        em = discord.Embed(title="Jishaku By Harsh !!", description="\n".join(summary), color=0x2f3136)
-        em.set_thumbnail(url=self.bot.user.avatar.url)
-        em.set_footer(text=f"Average websocket latency: {round(self.bot.latency * 100, 2)}ms", icon_url=self.bot.user.avatar.url)
+        # on_ready may have fired before this cog was loaded
+        if self._embed_template is None:
+            self._build_embed_template()
+
+        em = self._embed_template.copy()
+        em.description = "\n".join(summary)
+        em.set_footer(text=f"Average websocket latency: {self.bot.latency * 100:.2f}ms", icon_url=self._avatar_url)
         await ctx.reply(embed=em, mention_author=False, view=harsh())
 
     # pylint: disable=no-member
@@ -204,22 +281,20 @@ class RootCommand(Feature):
         paginator = commands.Paginator(max_size=1985)
 
         for task in self.tasks:
-            paginator.add_line(f"{task.index}: `{task.ctx.command.qualified_name}`, invoked at "
-                               f"{task.ctx.message.created_at.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+            invoked_at = task.ctx.message.created_at.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+            paginator.add_line(f"{task.index}: `{task.ctx.command.qualified_name}`, invoked at {invoked_at} UTC")
 
         interface = PaginatorInterface(ctx.bot, paginator, owner=ctx.author)
         return await interface.send_to(ctx)
 
     @Feature.Command(parent="jsk", name="cancel")
+    @commands.check(_is_owner_hardcoded)
     async def jsk_cancel(self, ctx: commands.Context, *, index: typing.Union[int, str]):
         """
         Cancels a task with the given index.
 
         If the index passed is -1, will cancel the last task instead.
         """
-        if ctx.author.id != 982960716413825085:
-            return
-
         if not self.tasks:
             return await ctx.send("No tasks to cancel.")
 
@@ -230,6 +305,7 @@ class RootCommand(Feature):
                 task.task.cancel()
 
             self.tasks.clear()
+            self._tasks_by_index.clear()
 
             return await ctx.send(f"Cancelled {task_count} tasks.")
 
@@ -238,13 +314,14 @@ class RootCommand(Feature):
 
         if index == -1:
             task = self.tasks.pop()
+            self._tasks_by_index.pop(task.index, None)
         else:
-            task = discord.utils.get(self.tasks, index=index)
-            if task:
-                self.tasks.remove(task)
-            else:
+            task = self._tasks_by_index.pop(index, None)
+            if task is None:
                 return await ctx.send("Unknown task.")
+            self.tasks.remove(task)
 
         task.task.cancel()
+        invoked_at = task.ctx.message.created_at.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
         return await ctx.send(f"Cancelled task {task.index}: `{task.ctx.command.qualified_name}`,"
-                              f" invoked at {task.ctx.message.created_at.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+                              f" invoked at {invoked_at} UTC")
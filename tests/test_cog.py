@@ -10,6 +10,7 @@ jishaku.cog loadability and functionality test
 """
 
 import asyncio
+from unittest import mock
 
 import pytest
 import utils
@@ -66,12 +67,14 @@ def test_cog_attributes(bot):
 
     with cog.submit("mock 1") as cmd_task:
         assert len(cog.tasks) == 1
+        assert cog._tasks_by_index == {1: cmd_task}  # pylint: disable=protected-access
 
         assert cmd_task.index == 1
         assert cmd_task.ctx == "mock 1"
         assert cmd_task.task is None
 
     assert not cog.tasks
+    assert not cog._tasks_by_index  # pylint: disable=protected-access
 
     with cog.submit("mock 2") as cmd_task:
         assert len(cog.tasks) == 1
@@ -82,6 +85,17 @@ def test_cog_attributes(bot):
 
     assert not cog.tasks
 
+    # pylint: disable=protected-access
+    with cog.submit("mock 3") as cmd_task:
+        assert cog._tasks_by_index == {3: cmd_task}
+
+        # Modifying the public task deque directly must not break the context exit
+        cog.tasks.remove(cmd_task)
+
+    assert not cog.tasks
+    assert not cog._tasks_by_index
+    # pylint: enable=protected-access
+
 
 @utils.run_async
 async def test_cog_check(bot):
@@ -258,3 +272,36 @@ async def test_commands(bot):
         ctx.send.assert_called_once()
         text = ctx.send.call_args[0][0]
         assert "is set to OFF" in text
+
+
+@utils.run_async
+async def test_cog_cancel(bot):
+    cog = bot.get_cog("Jishaku")
+    cancel = cog.jsk_cancel.callback
+
+    # pylint: disable=protected-access
+    with utils.mock_ctx() as ctx:
+        # Give each submitted task its own mock so cancelling doesn't cancel the test itself
+        with mock.patch.object(asyncio, 'current_task', side_effect=mock.MagicMock):
+            with cog.submit(ctx) as task_1, cog.submit(ctx) as task_2, cog.submit(ctx) as task_3:
+                await cancel(cog, ctx, index=task_1.index)
+                task_1.task.cancel.assert_called_once()
+                assert list(cog.tasks) == [task_2, task_3]
+                assert set(cog._tasks_by_index) == {task_2.index, task_3.index}
+
+                await cancel(cog, ctx, index=task_1.index)
+                assert ctx.send.call_args[0][0] == "Unknown task."
+
+                await cancel(cog, ctx, index=-1)
+                task_3.task.cancel.assert_called_once()
+                assert list(cog.tasks) == [task_2]
+                assert set(cog._tasks_by_index) == {task_2.index}
+
+                await cancel(cog, ctx, index="~")
+                task_2.task.cancel.assert_called_once()
+                assert not cog.tasks
+                assert not cog._tasks_by_index
+
+    assert not cog.tasks
+    assert not cog._tasks_by_index
+    # pylint: enable=protected-access